@@ -6,6 +6,7 @@ Provides comprehensive backtesting capabilities for trading strategies.
 
 from typing import Dict, List, Optional, Callable
 from datetime import datetime, date, timedelta
+from bisect import bisect_left, bisect_right
 
 from stocksimulator.models.portfolio import Portfolio
 from stocksimulator.models.market_data import MarketData, OHLCV
@@ -13,6 +14,15 @@ from stocksimulator.models.transaction import Transaction
 from stocksimulator.core.risk_calculator import RiskCalculator
 
 
+# Minimum days between rebalances for each rebalance_frequency
+_REBALANCE_INTERVAL_DAYS = {
+    'daily': 0,
+    'weekly': 7,
+    'monthly': 30,
+    'quarterly': 90
+}
+
+
 class BacktestResult:
     """Container for backtest results."""
 
@@ -39,7 +49,7 @@ class BacktestResult:
 
         # Calculate basic metrics
         self.total_return = ((final_value - initial_value) / initial_value) * 100
-        days = (end_date - start_date).days
+        days = end_date.toordinal() - start_date.toordinal()
         years = days / 365.25
         self.annualized_return = ((final_value / initial_value) ** (1 / years) - 1) * 100 if years > 0 else 0
 
@@ -57,15 +67,20 @@ class BacktestResult:
         """Get summary of performance metrics."""
         risk_calc = RiskCalculator()
 
-        # Extract daily values
-        daily_values = [pv['total_value'] for pv in self.portfolio_values]
-        dates = [pv['date'] for pv in self.portfolio_values]
-
-        # Calculate returns
+        # Extract daily values, returns and winning days in one pass
+        daily_values = []
         daily_returns = []
-        for i in range(1, len(daily_values)):
-            ret = (daily_values[i] - daily_values[i-1]) / daily_values[i-1]
-            daily_returns.append(ret)
+        winning_days = 0
+        prev_value = None
+        for pv in self.portfolio_values:
+            value = pv['total_value']
+            if prev_value is not None:
+                ret = (value - prev_value) / prev_value
+                daily_returns.append(ret)
+                if ret > 0:
+                    winning_days += 1
+            daily_values.append(value)
+            prev_value = value
 
         # Calculate risk metrics
         volatility = risk_calc.calculate_volatility(daily_returns) if daily_returns else 0
@@ -73,14 +88,13 @@ class BacktestResult:
         max_dd = risk_calc.calculate_max_drawdown(daily_values)
 
         # Win rate
-        winning_days = sum(1 for r in daily_returns if r > 0)
         win_rate = (winning_days / len(daily_returns) * 100) if daily_returns else 0
 
         return {
             'strategy_name': self.strategy_name,
             'start_date': self.start_date.isoformat(),
             'end_date': self.end_date.isoformat(),
-            'days': (self.end_date - self.start_date).days,
+            'days': self.end_date.toordinal() - self.start_date.toordinal(),
             'initial_value': self.initial_value,
             'final_value': self.final_value,
             'total_return': self.total_return,
@@ -157,14 +171,13 @@ class Backtester:
         # Determine date range
         all_dates = set()
         for md in market_data.values():
-            all_dates.update(d.date for d in md.data)
+            all_dates.update(md.as_columns()['date'])
 
         sorted_dates = sorted(all_dates)
 
-        if start_date:
-            sorted_dates = [d for d in sorted_dates if d >= start_date]
-        if end_date:
-            sorted_dates = [d for d in sorted_dates if d <= end_date]
+        lo = bisect_left(sorted_dates, start_date) if start_date else 0
+        hi = bisect_right(sorted_dates, end_date) if end_date else len(sorted_dates)
+        sorted_dates = sorted_dates[lo:hi]
 
         if not sorted_dates:
             raise ValueError("No data available in specified date range")
@@ -175,8 +188,10 @@ class Backtester:
         # Track portfolio values over time
         portfolio_values = []
 
-        # Simulation loop
+        # Simulation loop (unknown frequencies rebalance only on the first day)
         last_rebalance = None
+        next_rebalance = None
+        rebalance_interval = _REBALANCE_INTERVAL_DAYS.get(rebalance_frequency)
 
         for current_date in sorted_dates:
             # Get current prices
@@ -190,18 +205,12 @@ class Backtester:
                 continue
 
             # Check if we should rebalance
-            should_rebalance = False
-
             if last_rebalance is None:
                 should_rebalance = True
-            elif rebalance_frequency == 'daily':
-                should_rebalance = True
-            elif rebalance_frequency == 'weekly' and (current_date - last_rebalance).days >= 7:
-                should_rebalance = True
-            elif rebalance_frequency == 'monthly' and (current_date - last_rebalance).days >= 30:
-                should_rebalance = True
-            elif rebalance_frequency == 'quarterly' and (current_date - last_rebalance).days >= 90:
-                should_rebalance = True
+            elif next_rebalance is None:
+                should_rebalance = False
+            else:
+                should_rebalance = current_date >= next_rebalance
 
             # Execute rebalancing
             if should_rebalance:
@@ -223,6 +232,10 @@ class Backtester:
 
                 last_rebalance = current_date
 
+                # Compare dates directly instead of building a timedelta per day
+                if rebalance_interval is not None:
+                    next_rebalance = current_date + timedelta(days=rebalance_interval)
+
             # Record portfolio value
             total_value = portfolio.get_total_value(current_prices)
             portfolio_values.append({
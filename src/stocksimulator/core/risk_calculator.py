@@ -164,11 +164,13 @@ class RiskCalculator:
         max_dd = 0.0
 
         for value in values:
-            if value > peak:
+            # A new peak has zero drawdown, so only values below it need a division
+            if value >= peak:
                 peak = value
-
-            drawdown = (peak - value) / peak if peak > 0 else 0
-            max_dd = max(max_dd, drawdown)
+            elif peak > 0:
+                drawdown = (peak - value) / peak
+                if drawdown > max_dd:
+                    max_dd = drawdown
 
         return max_dd * 100  # Return as percentage
 
@@ -12,6 +12,30 @@ from typing import Dict, List, Optional
 from stocksimulator.models.market_data import MarketData, OHLCV
 
 
+def parse_iso_date(date_str: str) -> date:
+    """
+    Parse a YYYY-MM-DD date string.
+
+    Strings shaped exactly like YYYY-MM-DD go through date.fromisoformat,
+    which skips the format parsing and datetime construction of strptime.
+    Everything else (e.g. unpadded months or days) is left to strptime, so
+    the accepted formats do not depend on the Python version: from 3.11,
+    fromisoformat also accepts forms like '20200307' and '2020-W10-6'.
+
+    Args:
+        date_str: Date string
+
+    Returns:
+        Parsed date
+    """
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
 class CSVLoader:
     """
     Load market data from CSV files.
@@ -74,6 +98,12 @@ class CSVLoader:
 
         data_points = []
 
+        if date_format == '%Y-%m-%d':
+            parse_date = parse_iso_date
+        else:
+            def parse_date(date_str: str) -> date:
+                return datetime.strptime(date_str, date_format).date()
+
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
 
@@ -81,7 +111,7 @@ class CSVLoader:
                 try:
                     # Parse date
                     date_str = row[date_col]
-                    dt = datetime.strptime(date_str, date_format).date()
+                    dt = parse_date(date_str)
 
                     # Parse prices (use close if others not available)
                     close = float(row.get(close_col, 0))
@@ -4,13 +4,14 @@ Alpha Vantage Downloader
 Download historical data from Alpha Vantage API.
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 import os
 import time
 
 from stocksimulator.models.market_data import MarketData, OHLCV
 from stocksimulator.downloaders.base import DataDownloader
+from stocksimulator.data.loaders import parse_iso_date
 
 
 class AlphaVantageDownloader(DataDownloader):
@@ -100,7 +101,7 @@ class AlphaVantageDownloader(DataDownloader):
             data_points = []
 
             for date_str, values in time_series.items():
-                dt = datetime.strptime(date_str, '%Y-%m-%d').date()
+                dt = parse_iso_date(date_str)
 
                 # Filter by date range if provided
                 if start_date and dt < start_date:
@@ -89,19 +89,27 @@ class YahooFinanceDownloader(DataDownloader):
         if df.empty:
             raise ValueError(f"No data available for {symbol}")
 
-        # Convert to OHLCV objects
-        data_points = []
-        for idx, row in df.iterrows():
-            ohlcv = OHLCV(
-                date=idx.date(),
-                open=float(row['Open']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                close=float(row['Close']),
-                volume=int(row['Volume']),
-                adjusted_close=float(row['Close'])  # Use Close if Adj Close not available
+        # Convert to OHLCV objects, pulling each column out once instead of
+        # building a Series per row with iterrows()
+        data_points = [
+            OHLCV(
+                date=ts.date(),
+                open=o,
+                high=h,
+                low=l,
+                close=c,
+                volume=int(v),
+                adjusted_close=c  # Use Close if Adj Close not available
             )
-            data_points.append(ohlcv)
+            for ts, o, h, l, c, v in zip(
+                df.index,
+                df['Open'].astype(float).tolist(),
+                df['High'].astype(float).tolist(),
+                df['Low'].astype(float).tolist(),
+                df['Close'].astype(float).tolist(),
+                df['Volume'].tolist()
+            )
+        ]
 
         return MarketData(
             symbol=symbol,
@@ -4,6 +4,7 @@ Momentum Indicators
 
 from typing import List, Optional
 from dataclasses import dataclass
+import math
 
 
 @dataclass
@@ -34,9 +35,45 @@ class RSI:
 
         rsi_values = [None]  # First value
 
-        for i in range(self.period - 1, len(gains)):
-            avg_gain = sum(gains[i-self.period+1:i+1]) / self.period
-            avg_loss = sum(losses[i-self.period+1:i+1]) / self.period
+        # Running window sums, updated by one entry and one exit per step.
+        # Nonzero counts let empty windows reset their sum to exactly 0.0 so
+        # floating-point drift never leaks into the avg_loss == 0 check.
+        # A non-finite change would poison the sums for good, so windows
+        # containing one are summed directly and the sums are reseeded
+        # from the first clean window after it.
+        period = self.period
+        isfinite = math.isfinite
+        last_bad = max(
+            (j for j in range(period - 1) if not (isfinite(gains[j]) and isfinite(losses[j]))),
+            default=-1
+        )
+        reseed = True
+        gain_sum = loss_sum = 0.0
+        gain_count = loss_count = 0
+
+        for i in range(period - 1, len(gains)):
+            start = i - period + 1
+            if not (isfinite(gains[i]) and isfinite(losses[i])):
+                last_bad = i
+
+            if last_bad >= start or reseed:
+                gain_sum = sum(gains[start:i + 1])
+                loss_sum = sum(losses[start:i + 1])
+                gain_count = sum(1 for g in gains[start:i + 1] if g > 0)
+                loss_count = sum(1 for l in losses[start:i + 1] if l > 0)
+                reseed = last_bad >= start
+            else:
+                gain_sum += gains[i] - gains[start - 1]
+                loss_sum += losses[i] - losses[start - 1]
+                gain_count += (gains[i] > 0) - (gains[start - 1] > 0)
+                loss_count += (losses[i] > 0) - (losses[start - 1] > 0)
+                if gain_count == 0:
+                    gain_sum = 0.0
+                if loss_count == 0:
+                    loss_sum = 0.0
+
+            avg_gain = gain_sum / period
+            avg_loss = loss_sum / period
 
             if avg_loss == 0:
                 rsi_values.append(100.0)
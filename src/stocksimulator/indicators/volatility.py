@@ -4,6 +4,7 @@ Volatility Indicators
 
 from typing import List, Optional
 from dataclasses import dataclass
+import math
 
 
 @dataclass
@@ -61,14 +62,43 @@ class BollingerBands:
         if len(prices) < self.period:
             return [None] * len(prices)
 
-        results = [None] * (self.period - 1)
-
-        for i in range(self.period - 1, len(prices)):
-            window = prices[i-self.period+1:i+1]
-            middle = sum(window) / len(window)
-
-            variance = sum((p - middle) ** 2 for p in window) / len(window)
-            std_dev = variance ** 0.5
+        period = self.period
+        results = [None] * (period - 1)
+        isfinite = math.isfinite
+
+        # Mean and sum of squared deviations of the window are updated in
+        # O(1) as one price enters and one leaves (Welford's update),
+        # instead of rescanning the whole window. A non-finite price would
+        # poison the running sums for good, so windows containing one are
+        # computed directly and the sums are reseeded once it has left.
+        last_bad = max((j for j in range(period - 1) if not isfinite(prices[j])), default=-1)
+        reseed = True
+        middle = m2 = 0.0
+
+        for i in range(period - 1, len(prices)):
+            start = i - period + 1
+            if not isfinite(prices[i]):
+                last_bad = i
+
+            if last_bad >= start:
+                window = prices[start:i + 1]
+                middle = sum(window) / period
+                std_dev = (sum((p - middle) ** 2 for p in window) / period) ** 0.5
+                reseed = True
+            else:
+                if reseed:
+                    window = prices[start:i + 1]
+                    middle = sum(window) / period
+                    m2 = sum((p - middle) ** 2 for p in window)
+                    reseed = False
+                else:
+                    entering = prices[i]
+                    leaving = prices[start - 1]
+                    previous_middle = middle
+                    middle += (entering - leaving) / period
+                    m2 += (entering - leaving) * (entering - middle + leaving - previous_middle)
+
+                std_dev = (max(m2, 0.0) / period) ** 0.5
 
             upper = middle + self.num_std * std_dev
             lower = middle - self.num_std * std_dev
@@ -4,9 +4,10 @@ Market Data model
 Represents historical and real-time market data for securities.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any
 from datetime import datetime, date
 from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
 
 
 @dataclass
@@ -27,7 +28,8 @@ class MarketData:
 
     Attributes:
         symbol: Stock ticker symbol
-        data: List of OHLCV data points
+        data: List of OHLCV data points (call invalidate_cache() after
+            editing it in place)
         metadata: Additional metadata about the data source
     """
 
@@ -46,12 +48,43 @@ class MarketData:
             metadata: Optional metadata dictionary
         """
         self.symbol = symbol
-        self.data = data or []
+        self._data = data or []
         self.metadata = metadata or {}
 
+        # Views derived from _data (date index, sorted list, columns), built
+        # on first use so per-day lookups in a backtest do not rescan it
+        self._derived: Dict[str, Any] = {}
+
+    @property
+    def data(self) -> List[OHLCV]:
+        """
+        List of OHLCV data points.
+
+        Assigning a new list or calling add_data_point refreshes the cached
+        lookup views. After editing the list or its points in place, call
+        invalidate_cache() so later lookups see the change.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: List[OHLCV]) -> None:
+        self._data = value
+        self.invalidate_cache()
+
     def add_data_point(self, ohlcv: OHLCV) -> None:
         """Add a data point."""
-        self.data.append(ohlcv)
+        self._data.append(ohlcv)
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached lookup views (date index, sorted data, columns).
+
+        Must be called after modifying data or its OHLCV points in place,
+        e.g. md.data.sort(...) or md.data[0].close = ...; the views are
+        rebuilt on next use.
+        """
+        self._derived = {}
 
     def get_data_range(
         self,
@@ -69,13 +102,139 @@ class MarketData:
             List of OHLCV data points within range
         """
         return [
-            d for d in self.data
+            d for d in self._data
             if start_date <= d.date <= end_date
         ]
 
+    def slice(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> 'MarketData':
+        """
+        Get a copy of this market data restricted to a date range.
+
+        Bounds are located by binary search over the date-sorted data, so
+        callers that reuse one window many times can slice once up front.
+
+        Args:
+            start_date: Start date (inclusive, None = earliest data)
+            end_date: End date (inclusive, None = latest data)
+
+        Returns:
+            New MarketData sharing the same OHLCV objects (after editing a
+            point through either object, call invalidate_cache() on both)
+        """
+        sorted_data = self.get_sorted_data()
+        dates = self.as_columns()['date']
+
+        lo = bisect_left(dates, start_date) if start_date else 0
+        hi = bisect_right(dates, end_date) if end_date else len(dates)
+
+        return MarketData(
+            symbol=self.symbol,
+            data=sorted_data[lo:hi],
+            metadata=dict(self.metadata)
+        )
+
+    def _get_date_index(self) -> Dict[date, int]:
+        """Get a map from date to position in the as_columns() lists."""
+        derived = self._derived
+        if 'date_index' not in derived:
+            index: Dict[date, int] = {}
+            for i, d in enumerate(self.as_columns()['date']):
+                index.setdefault(d, i)
+            derived['date_index'] = index
+        return derived['date_index']
+
+    def _get_prices(self) -> List[float]:
+        """Get adjusted close (falling back to close) per as_columns() row."""
+        derived = self._derived
+        if 'prices' not in derived:
+            columns = self.as_columns()
+            derived['prices'] = [
+                adjusted or close
+                for adjusted, close in zip(columns['adjusted_close'], columns['close'])
+            ]
+        return derived['prices']
+
+    def get_sorted_data(self) -> List[OHLCV]:
+        """
+        Get data points in date order.
+
+        Returns:
+            Cached list of OHLCV data points sorted by date (do not modify;
+            rebuilt after data is replaced or extended, or the cache is
+            invalidated)
+        """
+        derived = self._derived
+        if 'sorted_data' not in derived:
+            derived['sorted_data'] = sorted(self._data, key=lambda x: x.date)
+        return derived['sorted_data']
+
+    def as_columns(self) -> Dict[str, List]:
+        """
+        Get data as parallel per-field lists in date order.
+
+        Numeric passes over one field (e.g. closes over a window) can slice
+        these lists directly instead of reading each OHLCV object.
+
+        Returns:
+            Cached dictionary of field name -> list (do not modify;
+            rebuilt after data is replaced or extended, or the cache is
+            invalidated)
+
+        Example:
+            >>> columns = spy_data.as_columns()
+            >>> i = bisect_right(columns['date'], current_date)
+            >>> recent_closes = columns['close'][max(0, i - 20):i]
+        """
+        derived = self._derived
+        if 'columns' not in derived:
+            sorted_data = self.get_sorted_data()
+            derived['columns'] = {
+                'date': [d.date for d in sorted_data],
+                'open': [d.open for d in sorted_data],
+                'high': [d.high for d in sorted_data],
+                'low': [d.low for d in sorted_data],
+                'close': [d.close for d in sorted_data],
+                'volume': [d.volume for d in sorted_data],
+                'adjusted_close': [d.adjusted_close for d in sorted_data]
+            }
+        return derived['columns']
+
+    def window(
+        self,
+        end_date: date,
+        length: int,
+        field: str = 'close'
+    ) -> List:
+        """
+        Get the last values of one field up to a date.
+
+        Reads from the cached columns, so strategies that need a whole
+        lookback window of prices get a flat list without touching the
+        OHLCV objects.
+
+        Args:
+            end_date: Last date of the window (inclusive)
+            length: Maximum number of values to return
+            field: Which column to read ('close', 'open', 'volume', ...)
+
+        Returns:
+            Up to length values in date order (fewer if history is short)
+
+        Example:
+            >>> closes = spy_data.window(current_date, 200)
+            >>> sma_200 = sum(closes) / len(closes)
+        """
+        columns = self.as_columns()
+        end_idx = bisect_right(columns['date'], end_date)
+        return columns[field][max(0, end_idx - length):end_idx]
+
     def get_latest(self, n: int = 1) -> List[OHLCV]:
         """Get the latest n data points."""
-        return sorted(self.data, key=lambda x: x.date, reverse=True)[:n]
+        return sorted(self._data, key=lambda x: x.date, reverse=True)[:n]
 
     def get_price_on_date(self, target_date: date) -> Optional[float]:
         """
@@ -87,10 +246,10 @@ class MarketData:
         Returns:
             Closing price or None if not found
         """
-        for d in self.data:
-            if d.date == target_date:
-                return d.adjusted_close or d.close
-        return None
+        i = self._get_date_index().get(target_date)
+        if i is None:
+            return None
+        return self._get_prices()[i]
 
     def get_returns(self, period_days: int = 1) -> List[Dict]:
         """
@@ -102,20 +261,18 @@ class MarketData:
         Returns:
             List of dictionaries with date and return
         """
-        sorted_data = sorted(self.data, key=lambda x: x.date)
+        dates = self.as_columns()['date']
+        prices = self._get_prices()
         returns = []
 
-        for i in range(period_days, len(sorted_data)):
-            current = sorted_data[i]
-            previous = sorted_data[i - period_days]
-
-            current_price = current.adjusted_close or current.close
-            previous_price = previous.adjusted_close or previous.close
+        for i in range(period_days, len(prices)):
+            current_price = prices[i]
+            previous_price = prices[i - period_days]
 
             if previous_price > 0:
                 ret = (current_price - previous_price) / previous_price
                 returns.append({
-                    'date': current.date,
+                    'date': dates[i],
                     'return': ret,
                     'price': current_price
                 })
@@ -157,28 +314,27 @@ class MarketData:
         Returns:
             Dictionary with max_drawdown, peak_date, trough_date
         """
-        sorted_data = sorted(self.data, key=lambda x: x.date)
+        columns = self.as_columns()
+        dates = columns['date']
 
-        if not sorted_data:
+        if not dates:
             return {'max_drawdown': 0, 'peak_date': None, 'trough_date': None}
 
-        peak = sorted_data[0].close
-        peak_date = sorted_data[0].date
+        peak = columns['close'][0]
+        peak_date = dates[0]
         max_dd = 0
         trough_date = None
 
-        for d in sorted_data:
-            price = d.adjusted_close or d.close
-
+        for d, price in zip(dates, self._get_prices()):
             if price > peak:
+                # A new peak has zero drawdown; nothing else to update
                 peak = price
-                peak_date = d.date
-
-            drawdown = (peak - price) / peak if peak > 0 else 0
-
-            if drawdown > max_dd:
-                max_dd = drawdown
-                trough_date = d.date
+                peak_date = d
+            elif peak > 0:
+                drawdown = (peak - price) / peak
+                if drawdown > max_dd:
+                    max_dd = drawdown
+                    trough_date = d
 
         return {
             'max_drawdown': max_dd * 100,  # As percentage
@@ -198,8 +354,8 @@ class MarketData:
                 'volume': d.volume,
                 'adjusted_close': d.adjusted_close
             }
-            for d in sorted(self.data, key=lambda x: x.date)
+            for d in sorted(self._data, key=lambda x: x.date)
         ]
 
     def __repr__(self) -> str:
-        return f"MarketData(symbol={self.symbol}, data_points={len(self.data)})"
+        return f"MarketData(symbol={self.symbol}, data_points={len(self._data)})"
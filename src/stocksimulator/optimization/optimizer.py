@@ -4,14 +4,74 @@ Strategy Parameter Optimization
 Grid search and optimization tools for finding optimal strategy parameters.
 """
 
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from typing import Dict, List, Any, Callable, Optional, Tuple, Iterator
 from datetime import date
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import itertools
+import math
+import os
 
 from stocksimulator.core.backtester import Backtester, BacktestResult
 from stocksimulator.models.market_data import MarketData
 
 
+_RULE = "=" * 80
+
+# Per-process state for parallel grid search, populated once by _init_worker
+# so market data is pickled once per worker rather than once per combination.
+_worker_context: Dict[str, Any] = {}
+
+
+def _init_worker(
+    optimizer: 'StrategyOptimizer',
+    strategy_class: type,
+    market_data: Dict[str, MarketData],
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> None:
+    """Store shared evaluation inputs in a worker process."""
+    _worker_context.update(
+        optimizer=optimizer,
+        strategy_class=strategy_class,
+        market_data=market_data,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+
+def _resolve_workers(n_jobs: Optional[int], n_tasks: int) -> int:
+    """
+    Translate an n_jobs setting into a worker process count.
+
+    Args:
+        n_jobs: Worker processes to use; None or -1 means one per CPU
+        n_tasks: Number of independent tasks to run
+
+    Returns:
+        Number of workers, never more than n_tasks (<= 1 means run serially)
+
+    Raises:
+        ValueError: If n_jobs is 0 or below -1
+    """
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer, -1 or None, got {n_jobs}")
+
+    return min(n_jobs, n_tasks)
+
+
+def _evaluate_in_worker(parameters: Dict[str, Any]) -> 'OptimizationResult':
+    """Evaluate one parameter combination using the worker's shared inputs."""
+    return _worker_context['optimizer'].evaluate_parameters(
+        _worker_context['strategy_class'],
+        parameters,
+        _worker_context['market_data'],
+        _worker_context['start_date'],
+        _worker_context['end_date']
+    )
+
+
 class OptimizationResult:
     """Result from parameter optimization."""
 
@@ -111,7 +171,10 @@ class GridSearchOptimizer(StrategyOptimizer):
         market_data: Dict[str, MarketData],
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        top_n: int = 5
+        top_n: int = 5,
+        n_jobs: Optional[int] = 1,
+        prune_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        verbose: bool = True
     ) -> List[OptimizationResult]:
         """
         Perform grid search optimization.
@@ -123,6 +186,14 @@ class GridSearchOptimizer(StrategyOptimizer):
             start_date: Backtest start date
             end_date: Backtest end date
             top_n: Number of top results to return
+            n_jobs: Number of worker processes (1 = serial, None or -1 = one
+                per CPU; 0 and other negative values raise ValueError).
+                Parallel runs require a picklable strategy class.
+            prune_fn: Optional predicate called with each parameter dict;
+                combinations for which it returns True are skipped without
+                running a backtest (e.g. lookbacks longer than the data)
+            verbose: Print progress and the top results (False skips all
+                report formatting, e.g. for large sweeps)
 
         Returns:
             List of top N optimization results
@@ -138,64 +209,141 @@ class GridSearchOptimizer(StrategyOptimizer):
             >>> best = results[0]
             >>> print(f"Best params: {best.parameters}, Sharpe: {best.metric_value:.3f}")
         """
-        print(f"Starting grid search optimization...")
-        print(f"  Strategy: {strategy_class.__name__}")
-        print(f"  Parameters: {list(param_grid.keys())}")
-        print(f"  Combinations: {self._count_combinations(param_grid)}")
-        print(f"  Optimizing for: {self.optimization_metric}")
-        print()
+        if verbose:
+            print("\n".join([
+                "Starting grid search optimization...",
+                f"  Strategy: {strategy_class.__name__}",
+                f"  Parameters: {list(param_grid.keys())}",
+                f"  Combinations: {self._count_combinations(param_grid)}",
+                f"  Optimizing for: {self.optimization_metric}",
+                ""
+            ]))
 
         # Generate all parameter combinations
         param_names = list(param_grid.keys())
         param_values = list(param_grid.values())
-        combinations = list(itertools.product(*param_values))
-
-        results = []
-        total = len(combinations)
+        param_sets = [dict(zip(param_names, combination))
+                      for combination in itertools.product(*param_values)]
+
+        if prune_fn:
+            kept = [params for params in param_sets if not prune_fn(params)]
+            if verbose and len(kept) < len(param_sets):
+                print(f"  Pruned {len(param_sets) - len(kept)} combinations before backtesting\n")
+            param_sets = kept
+
+        # Drop bars after the window once instead of on every backtest.
+        # Earlier bars are kept since strategies need them for lookbacks.
+        if end_date:
+            market_data = {
+                symbol: md.slice(end_date=end_date)
+                for symbol, md in market_data.items()
+            }
+
+        results_by_index = {}
+        total = len(param_sets)
+
+        evaluations = self._evaluate_combinations(
+            strategy_class,
+            param_sets,
+            market_data,
+            start_date,
+            end_date,
+            n_jobs
+        )
 
-        for i, combination in enumerate(combinations, 1):
-            # Create parameter dict
-            params = dict(zip(param_names, combination))
+        for i, (index, outcome) in enumerate(evaluations, 1):
+            params = param_sets[index]
 
-            # Evaluate
-            try:
-                result = self.evaluate_parameters(
-                    strategy_class,
-                    params,
-                    market_data,
-                    start_date,
-                    end_date
-                )
-                results.append(result)
+            if isinstance(outcome, Exception):
+                if verbose:
+                    print(f"  [{i}/{total}] {params} → ERROR: {outcome}")
+                continue
 
-                print(f"  [{i}/{total}] {params} → {self.optimization_metric}={result.metric_value:.3f}")
+            results_by_index[index] = outcome
+            if verbose:
+                print(f"  [{i}/{total}] {params} → {self.optimization_metric}={outcome.metric_value:.3f}")
 
-            except Exception as e:
-                print(f"  [{i}/{total}] {params} → ERROR: {e}")
+        # Restore grid order so ties rank the same as a serial run
+        results = [results_by_index[index] for index in sorted(results_by_index)]
 
         # Sort by metric value (descending)
         results.sort(key=lambda r: r.metric_value, reverse=True)
 
-        print()
-        print("=" * 80)
-        print(f"OPTIMIZATION COMPLETE - Top {min(top_n, len(results))} Results")
-        print("=" * 80)
+        if not verbose:
+            return results[:top_n]
 
-        for i, result in enumerate(results[:top_n], 1):
-            print(f"\n{i}. {self.optimization_metric.upper()}: {result.metric_value:.3f}")
-            print(f"   Parameters: {result.parameters}")
+        # Build the report first and write it in one call
+        lines = [
+            "",
+            _RULE,
+            f"OPTIMIZATION COMPLETE - Top {min(top_n, len(results))} Results",
+            _RULE
+        ]
 
+        for i, result in enumerate(results[:top_n], 1):
             summary = result.backtest_result.get_performance_summary()
-            print(f"   Return: {summary['annualized_return']:.2f}%")
-            print(f"   Max DD: {summary['max_drawdown']:.2f}%")
+            lines.extend([
+                f"\n{i}. {self.optimization_metric.upper()}: {result.metric_value:.3f}",
+                f"   Parameters: {result.parameters}",
+                f"   Return: {summary['annualized_return']:.2f}%",
+                f"   Max DD: {summary['max_drawdown']:.2f}%"
+            ])
+
+        print("\n".join(lines))
 
         return results[:top_n]
 
+    def _evaluate_combinations(
+        self,
+        strategy_class: type,
+        param_sets: List[Dict[str, Any]],
+        market_data: Dict[str, MarketData],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        n_jobs: Optional[int]
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Evaluate parameter sets serially or in a process pool.
+
+        Yields:
+            (index into param_sets, OptimizationResult or raised Exception)
+            in completion order
+        """
+        workers = _resolve_workers(n_jobs, len(param_sets))
+
+        if workers <= 1:
+            for index, parameters in enumerate(param_sets):
+                try:
+                    yield index, self.evaluate_parameters(
+                        strategy_class,
+                        parameters,
+                        market_data,
+                        start_date,
+                        end_date
+                    )
+                except Exception as e:
+                    yield index, e
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self, strategy_class, market_data, start_date, end_date)
+        ) as executor:
+            futures = {
+                executor.submit(_evaluate_in_worker, parameters): index
+                for index, parameters in enumerate(param_sets)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    yield index, future.result()
+                except Exception as e:
+                    yield index, e
+
     def _count_combinations(self, param_grid: Dict[str, List[Any]]) -> int:
         """Count total number of parameter combinations."""
-        count = 1
-        for values in param_grid.values():
-            count *= len(values)
-        return count
+        return math.prod(len(values) for values in param_grid.values())
 
 
@@ -4,7 +4,7 @@ Position Sizing
 Methods for determining optimal position sizes.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import math
 
 
@@ -25,6 +25,52 @@ class PositionSizer:
         raise NotImplementedError
 
 
+def _kelly_fraction(win_rate: float, avg_win: float, avg_loss: float) -> float:
+    """Full Kelly fraction clamped to 0-100% (0 when there is no edge)."""
+    if avg_win <= 0 or avg_loss <= 0:
+        return 0.0
+
+    # Kelly formula, (p * b - q) / b with b = avg_win / avg_loss
+    edge = win_rate * avg_win - (1 - win_rate) * avg_loss
+    if edge <= 0:
+        return 0.0
+
+    return min(edge / avg_win, 1.0)
+
+
+def _fixed_fractional_size(
+    account_value: float,
+    risk_pct: float,
+    stop_loss_pct: Optional[float] = None,
+    entry_price: Optional[float] = None,
+    stop_price: Optional[float] = None
+) -> float:
+    """Position size risking risk_pct of the account down to the stop."""
+    # Calculate risk per trade
+    risk_amount = account_value * risk_pct
+
+    # If stop loss percentage provided
+    if stop_loss_pct:
+        return risk_amount / stop_loss_pct
+
+    # If entry and stop prices provided
+    if entry_price and stop_price:
+        risk_per_share = abs(entry_price - stop_price)
+        if risk_per_share > 0:
+            shares = risk_amount / risk_per_share
+            return shares * entry_price
+
+    # Default: use risk amount
+    return risk_amount
+
+
+def _check_batch_lengths(**sequences: Sequence) -> None:
+    """Raise ValueError unless all batch inputs have the same length."""
+    lengths = {name: len(values) for name, values in sequences.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Batch inputs must have the same length, got {lengths}")
+
+
 class KellyCriterion(PositionSizer):
     """
     Kelly Criterion position sizing.
@@ -77,23 +123,55 @@ class KellyCriterion(PositionSizer):
             ... )
             >>> print(f"Position size: ${position:,.2f}")
         """
-        if avg_loss == 0:
-            return 0.0
+        return account_value * _kelly_fraction(win_rate, avg_win, avg_loss) * self.fraction
+
+    def calculate_position_size_batch(
+        self,
+        account_values: Sequence[float],
+        win_rates: Sequence[float],
+        avg_wins: Sequence[float],
+        avg_losses: Sequence[float]
+    ) -> List[float]:
+        """
+        Calculate Kelly position sizes for many trades in one call.
 
-        p = win_rate
-        q = 1 - win_rate
-        b = avg_win / avg_loss
+        Equivalent to calling calculate_position_size for each element,
+        without the per-trade method call.
 
-        # Kelly formula
-        kelly_pct = (p * b - q) / b
+        Args:
+            account_values: Account value per trade
+            win_rates: Win rate per trade (0-1)
+            avg_wins: Average winning trade per trade
+            avg_losses: Average losing trade per trade (positive numbers)
+
+        Returns:
+            List of position sizes in dollars
+
+        Raises:
+            ValueError: If the input sequences differ in length
 
-        # Clamp to 0-100%
-        kelly_pct = max(0.0, min(1.0, kelly_pct))
+        Example:
+            >>> kelly = KellyCriterion(fraction=0.5)
+            >>> kelly.calculate_position_size_batch(
+            ...     [100000, 50000], [0.60, 0.55], [0.05, 0.04], [0.03, 0.03]
+            ... )
+        """
+        _check_batch_lengths(
+            account_values=account_values,
+            win_rates=win_rates,
+            avg_wins=avg_wins,
+            avg_losses=avg_losses
+        )
 
-        # Apply fractional Kelly
-        kelly_pct *= self.fraction
+        fraction = self.fraction
+        kelly_fraction = _kelly_fraction
 
-        return account_value * kelly_pct
+        return [
+            account_value * kelly_fraction(p, avg_win, avg_loss) * fraction
+            for account_value, p, avg_win, avg_loss in zip(
+                account_values, win_rates, avg_wins, avg_losses
+            )
+        ]
 
 
 class FixedFractional(PositionSizer):
@@ -139,23 +217,37 @@ class FixedFractional(PositionSizer):
             ... )
             >>> print(f"Position size: ${position:,.2f}")
         """
-        # Calculate risk per trade
-        risk_amount = account_value * self.risk_pct
+        return _fixed_fractional_size(
+            account_value, self.risk_pct, stop_loss_pct, entry_price, stop_price
+        )
 
-        # If stop loss percentage provided
-        if stop_loss_pct:
-            position_size = risk_amount / stop_loss_pct
-            return position_size
+    def calculate_position_size_batch(
+        self,
+        account_values: Sequence[float],
+        stop_loss_pcts: Sequence[Optional[float]]
+    ) -> List[float]:
+        """
+        Calculate fixed fractional position sizes for many trades in one call.
 
-        # If entry and stop prices provided
-        if entry_price and stop_price:
-            risk_per_share = abs(entry_price - stop_price)
-            if risk_per_share > 0:
-                shares = risk_amount / risk_per_share
-                position_size = shares * entry_price
-                return position_size
+        Equivalent to calling calculate_position_size with stop_loss_pct for
+        each element; a missing or zero stop falls back to the risk amount.
+
+        Args:
+            account_values: Account value per trade
+            stop_loss_pcts: Stop loss percentage per trade
 
-        # Default: use risk amount
-        return risk_amount
+        Returns:
+            List of position sizes in dollars
+
+        Raises:
+            ValueError: If the input sequences differ in length
+        """
+        _check_batch_lengths(account_values=account_values, stop_loss_pcts=stop_loss_pcts)
 
+        risk_pct = self.risk_pct
+        fixed_fractional_size = _fixed_fractional_size
 
+        return [
+            fixed_fractional_size(account_value, risk_pct, stop_loss_pct)
+            for account_value, stop_loss_pct in zip(account_values, stop_loss_pcts)
+        ]
@@ -4,12 +4,122 @@ Walk-Forward Analysis
 Out-of-sample testing to avoid overfitting.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import date, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from stocksimulator.core.backtester import Backtester
 from stocksimulator.models.market_data import MarketData
-from stocksimulator.optimization.optimizer import GridSearchOptimizer
+from stocksimulator.optimization.optimizer import GridSearchOptimizer, _resolve_workers
+
+
+_RULE = "=" * 80
+
+# (period_num, train_start, train_end, test_start, test_end)
+Window = Tuple[int, date, date, date, date]
+
+# Per-process state for parallel walk-forward analysis, populated once by
+# _init_window_worker so market data is pickled once per worker.
+_window_context: Dict[str, Any] = {}
+
+
+def _init_window_worker(
+    optimizer: GridSearchOptimizer,
+    strategy_class: type,
+    param_grid: Dict[str, List[Any]],
+    market_data: Dict[str, MarketData]
+) -> None:
+    """Store shared walk-forward inputs in a worker process."""
+    _window_context.update(
+        optimizer=optimizer,
+        strategy_class=strategy_class,
+        param_grid=param_grid,
+        market_data=market_data
+    )
+
+
+def _run_window(
+    optimizer: GridSearchOptimizer,
+    window: Window,
+    strategy_class: type,
+    param_grid: Dict[str, List[Any]],
+    market_data: Dict[str, MarketData],
+    verbose: bool = True
+) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Optimize on one training window and evaluate on its test window.
+
+    Args:
+        optimizer: Optimizer used for both the search and the evaluation
+        window: Window definition
+        strategy_class: Strategy class to analyze
+        param_grid: Parameter grid for optimization
+        market_data: Market data
+        verbose: Print grid search progress
+
+    Returns:
+        (train_entry, test_entry), or None if training produced no results
+    """
+    period_num, train_start, train_end, test_start, test_end = window
+
+    train_results_list = optimizer.optimize(
+        strategy_class=strategy_class,
+        param_grid=param_grid,
+        market_data=market_data,
+        start_date=train_start,
+        end_date=train_end,
+        top_n=1,
+        verbose=verbose
+    )
+
+    if not train_results_list:
+        return None
+
+    best_params = train_results_list[0].parameters
+    train_metric = train_results_list[0].metric_value
+
+    test_result = optimizer.evaluate_parameters(
+        strategy_class=strategy_class,
+        parameters=best_params,
+        market_data=market_data,
+        start_date=test_start,
+        end_date=test_end
+    )
+
+    train_entry = {
+        'period': period_num,
+        'start': train_start,
+        'end': train_end,
+        'parameters': best_params,
+        'sharpe': train_metric
+    }
+
+    test_entry = {
+        'period': period_num,
+        'start': test_start,
+        'end': test_end,
+        'parameters': best_params,
+        'summary': test_result.backtest_result.get_performance_summary()
+    }
+
+    return train_entry, test_entry
+
+
+def _run_window_in_worker(window: Window) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Run one window using the worker's shared inputs.
+
+    The grid search always runs quietly here: workers finish out of order,
+    so their progress lines could not be matched to a period header.
+    """
+    return _run_window(
+        _window_context['optimizer'],
+        window,
+        _window_context['strategy_class'],
+        _window_context['param_grid'],
+        _window_context['market_data'],
+        verbose=False
+    )
 
 
 class WalkForwardResult:
@@ -33,15 +143,19 @@ class WalkForwardResult:
 
         test_metrics = [r['summary'] for r in self.test_results]
 
-        avg_return = sum(m['annualized_return'] for m in test_metrics) / len(test_metrics)
-        avg_sharpe = sum(m['sharpe_ratio'] for m in test_metrics) / len(test_metrics)
-        avg_dd = sum(m['max_drawdown'] for m in test_metrics) / len(test_metrics)
+        total_return = total_sharpe = total_dd = 0.0
+        for m in test_metrics:
+            total_return += m['annualized_return']
+            total_sharpe += m['sharpe_ratio']
+            total_dd += m['max_drawdown']
+
+        n = len(test_metrics)
 
         return {
-            'num_periods': len(self.test_results),
-            'avg_return': avg_return,
-            'avg_sharpe': avg_sharpe,
-            'avg_max_drawdown': avg_dd,
+            'num_periods': n,
+            'avg_return': total_return / n,
+            'avg_sharpe': total_sharpe / n,
+            'avg_max_drawdown': total_dd / n,
             'test_results': test_metrics
         }
 
@@ -63,6 +177,12 @@ class WalkForwardAnalyzer:
         """
         self.backtester = backtester or Backtester(initial_cash=100000.0)
 
+        # Reused by every serial window and analyze call
+        self.optimizer = GridSearchOptimizer(
+            backtester=self.backtester,
+            optimization_metric='sharpe_ratio'
+        )
+
     def analyze(
         self,
         strategy_class: type,
@@ -70,7 +190,9 @@ class WalkForwardAnalyzer:
         market_data: Dict[str, MarketData],
         train_days: int = 756,  # ~3 years
         test_days: int = 252,   # ~1 year
-        step_days: int = 63     # ~3 months
+        step_days: int = 63,    # ~3 months
+        n_jobs: Optional[int] = 1,
+        verbose: bool = True
     ) -> WalkForwardResult:
         """
         Perform walk-forward analysis.
@@ -87,6 +209,12 @@ class WalkForwardAnalyzer:
             train_days: Training period length
             test_days: Testing period length
             step_days: Step size between periods
+            n_jobs: Number of worker processes for windows (1 = serial,
+                None or -1 = one per CPU; 0 and other negative values
+                raise ValueError)
+            verbose: Print per-period and summary reports (False skips all
+                report formatting, including the inner grid searches; with
+                n_jobs != 1 the inner grid searches are always quiet)
 
         Returns:
             WalkForwardResult
@@ -104,112 +232,146 @@ class WalkForwardAnalyzer:
             >>> summary = result.get_summary()
             >>> print(f"Avg Out-of-Sample Sharpe: {summary['avg_sharpe']:.3f}")
         """
-        print("=" * 80)
-        print("WALK-FORWARD ANALYSIS")
-        print("=" * 80)
-        print(f"Strategy: {strategy_class.__name__}")
-        print(f"Train period: {train_days} days (~{train_days/252:.1f} years)")
-        print(f"Test period: {test_days} days (~{test_days/252:.1f} years)")
-        print(f"Step size: {step_days} days")
-        print()
-
-        # Get all dates from first symbol
-        first_symbol = list(market_data.keys())[0]
-        all_dates = sorted([d.date for d in market_data[first_symbol].data])
+        if verbose:
+            print("\n".join([
+                _RULE,
+                "WALK-FORWARD ANALYSIS",
+                _RULE,
+                f"Strategy: {strategy_class.__name__}",
+                f"Train period: {train_days} days (~{train_days/252:.1f} years)",
+                f"Test period: {test_days} days (~{test_days/252:.1f} years)",
+                f"Step size: {step_days} days",
+                ""
+            ]))
+
+        # Get all dates from first symbol, in date order
+        first_symbol = next(iter(market_data))
+        all_dates = market_data[first_symbol].as_columns()['date']
+
+        # Windows are independent, so lay them all out before running any
+        windows: List[Window] = []
+        current_idx = 0
+
+        while current_idx + train_days + test_days < len(all_dates):
+            windows.append((
+                len(windows) + 1,
+                all_dates[current_idx],
+                all_dates[min(current_idx + train_days, len(all_dates) - 1)],
+                all_dates[min(current_idx + train_days, len(all_dates) - 1)],
+                all_dates[min(current_idx + train_days + test_days, len(all_dates) - 1)]
+            ))
+            current_idx += step_days
 
         train_results = []
         test_results = []
 
-        period_num = 0
-        current_idx = 0
+        for window, outcome in self._run_windows(
+            windows, strategy_class, param_grid, market_data, n_jobs, verbose
+        ):
+            if isinstance(outcome, Exception):
+                if verbose:
+                    print(f"  Error in period {window[0]}: {outcome}")
+                continue
 
-        while current_idx + train_days + test_days < len(all_dates):
-            period_num += 1
-
-            # Define train and test periods
-            train_start = all_dates[current_idx]
-            train_end = all_dates[min(current_idx + train_days, len(all_dates) - 1)]
-            test_start = all_dates[min(current_idx + train_days, len(all_dates) - 1)]
-            test_end = all_dates[min(current_idx + train_days + test_days, len(all_dates) - 1)]
-
-            print(f"Period {period_num}:")
-            print(f"  Train: {train_start} to {train_end}")
-            print(f"  Test:  {test_start} to {test_end}")
-
-            # Optimize on training period
-            optimizer = GridSearchOptimizer(
-                backtester=self.backtester,
-                optimization_metric='sharpe_ratio'
-            )
-
-            try:
-                train_results_list = optimizer.optimize(
-                    strategy_class=strategy_class,
-                    param_grid=param_grid,
-                    market_data=market_data,
-                    start_date=train_start,
-                    end_date=train_end,
-                    top_n=1
-                )
-
-                if not train_results_list:
+            if outcome is None:
+                if verbose:
                     print("  No valid results in training period, skipping...")
-                    current_idx += step_days
-                    continue
-
-                best_params = train_results_list[0].parameters
-                train_metric = train_results_list[0].metric_value
-
-                print(f"  Best params: {best_params} (Sharpe: {train_metric:.3f})")
-
-                # Test on out-of-sample period
-                test_result = optimizer.evaluate_parameters(
-                    strategy_class=strategy_class,
-                    parameters=best_params,
-                    market_data=market_data,
-                    start_date=test_start,
-                    end_date=test_end
-                )
-
-                test_summary = test_result.backtest_result.get_performance_summary()
-
-                print(f"  Out-of-sample: Sharpe={test_summary['sharpe_ratio']:.3f}, "
-                      f"Return={test_summary['annualized_return']:.2f}%")
-                print()
-
-                train_results.append({
-                    'period': period_num,
-                    'start': train_start,
-                    'end': train_end,
-                    'parameters': best_params,
-                    'sharpe': train_metric
-                })
-
-                test_results.append({
-                    'period': period_num,
-                    'start': test_start,
-                    'end': test_end,
-                    'parameters': best_params,
-                    'summary': test_summary
-                })
-
-            except Exception as e:
-                print(f"  Error in period {period_num}: {e}")
-
-            # Step forward
-            current_idx += step_days
+                continue
 
-        print("=" * 80)
-        print("WALK-FORWARD SUMMARY")
-        print("=" * 80)
+            train_entry, test_entry = outcome
+
+            if verbose:
+                test_summary = test_entry['summary']
+                print("\n".join([
+                    f"  Best params: {train_entry['parameters']} "
+                    f"(Sharpe: {train_entry['sharpe']:.3f})",
+                    f"  Out-of-sample: Sharpe={test_summary['sharpe_ratio']:.3f}, "
+                    f"Return={test_summary['annualized_return']:.2f}%",
+                    ""
+                ]))
+
+            train_results.append(train_entry)
+            test_results.append(test_entry)
 
         result = WalkForwardResult(train_results, test_results)
+
+        if not verbose:
+            return result
+
         summary = result.get_summary()
 
+        lines = [_RULE, "WALK-FORWARD SUMMARY", _RULE]
+
         if summary:
-            print(f"Number of periods: {summary['num_periods']}")
-            print(f"Average out-of-sample return: {summary['avg_return']:.2f}%")
-            print(f"Average out-of-sample Sharpe: {summary['avg_sharpe']:.3f}")
-            print(f"Average max drawdown: {summary['avg_max_drawdown']:.2f}%")
+            lines.extend([
+                f"Number of periods: {summary['num_periods']}",
+                f"Average out-of-sample return: {summary['avg_return']:.2f}%",
+                f"Average out-of-sample Sharpe: {summary['avg_sharpe']:.3f}",
+                f"Average max drawdown: {summary['avg_max_drawdown']:.2f}%"
+            ])
+
+        print("\n".join(lines))
 
         return result
+
+    def _run_windows(
+        self,
+        windows: List[Window],
+        strategy_class: type,
+        param_grid: Dict[str, List[Any]],
+        market_data: Dict[str, MarketData],
+        n_jobs: Optional[int],
+        verbose: bool
+    ) -> Iterator[Tuple[Window, Any]]:
+        """
+        Run walk-forward windows, serially or across worker processes.
+
+        Yields (window, outcome) in period order, where outcome is the
+        _run_window result or the exception raised while running it.
+        """
+        workers = _resolve_workers(n_jobs, len(windows))
+
+        if workers <= 1:
+            for window in windows:
+                if verbose:
+                    self._print_window(window)
+                try:
+                    outcome = _run_window(
+                        self.optimizer, window, strategy_class, param_grid,
+                        market_data, verbose
+                    )
+                except Exception as e:
+                    outcome = e
+                yield window, outcome
+            return
+
+        outcomes: Dict[int, Any] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_window_worker,
+            initargs=(self.optimizer, strategy_class, param_grid, market_data)
+        ) as executor:
+            futures = {
+                executor.submit(_run_window_in_worker, window): window[0]
+                for window in windows
+            }
+
+            for future in as_completed(futures):
+                try:
+                    outcomes[futures[future]] = future.result()
+                except Exception as e:
+                    outcomes[futures[future]] = e
+
+        for window in windows:
+            if verbose:
+                self._print_window(window)
+            yield window, outcomes[window[0]]
+
+    @staticmethod
+    def _print_window(window: Window) -> None:
+        """Print the header for one walk-forward period."""
+        period_num, train_start, train_end, test_start, test_end = window
+        print(f"Period {period_num}:\n"
+              f"  Train: {train_start} to {train_end}\n"
+              f"  Test:  {test_start} to {test_end}")
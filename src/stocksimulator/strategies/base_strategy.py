@@ -7,6 +7,7 @@ Abstract base class for all trading strategies.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 from datetime import date
+from bisect import bisect_right
 
 from stocksimulator.models.portfolio import Portfolio
 from stocksimulator.models.market_data import MarketData
@@ -109,21 +110,53 @@ class BaseStrategy(ABC):
         Returns:
             List of OHLCV data points
         """
-        all_data = sorted(market_data.data, key=lambda x: x.date)
+        all_data = market_data.get_sorted_data()
 
-        # Find current date index
-        current_idx = None
-        for i, d in enumerate(all_data):
-            if d.date <= current_date:
-                current_idx = i
-            else:
-                break
+        # Index one past the last point on or before current_date
+        end_idx = bisect_right(market_data.as_columns()['date'], current_date)
 
-        if current_idx is None:
+        if end_idx == 0:
             return []
 
-        start_idx = max(0, current_idx - lookback_days + 1)
-        return all_data[start_idx:current_idx + 1]
+        start_idx = max(0, end_idx - lookback_days)
+        return all_data[start_idx:end_idx]
+
+    def get_lookback_return(
+        self,
+        market_data: MarketData,
+        current_date: date,
+        lookback_days: int,
+        price_field: str = 'close'
+    ) -> Optional[float]:
+        """
+        Get total return over the lookback period.
+
+        Same result as comparing the first and last points returned by
+        get_lookback_data, but reads the two prices from the cached price
+        columns instead of building the lookback list.
+
+        Args:
+            market_data: MarketData object
+            current_date: Current date
+            lookback_days: Number of days to look back
+            price_field: Which price to use ('open', 'high', 'low', 'close')
+
+        Returns:
+            Total return or None if insufficient data
+        """
+        columns = market_data.as_columns()
+        end_idx = bisect_right(columns['date'], current_date)
+
+        if lookback_days < 1 or end_idx < lookback_days:
+            return None
+
+        prices = columns[price_field]
+        start_price = prices[end_idx - lookback_days]
+
+        if start_price <= 0:
+            return None
+
+        return (prices[end_idx - 1] - start_price) / start_price
 
     def calculate_moving_average(
         self,
@@ -6,6 +6,8 @@ Implements momentum-based trading strategies that follow trends.
 
 from typing import Dict, List, Optional
 from datetime import date
+from operator import itemgetter
+import heapq
 
 from stocksimulator.strategies.base_strategy import BaseStrategy
 from stocksimulator.models.portfolio import Portfolio
@@ -81,20 +83,7 @@ class MomentumStrategy(BaseStrategy):
         Returns:
             Momentum (total return) or None if insufficient data
         """
-        data = self.get_lookback_data(market_data, current_date, lookback_days)
-
-        if len(data) < lookback_days:
-            return None
-
-        start_price = data[0].close
-        end_price = data[-1].close
-
-        if start_price <= 0:
-            return None
-
-        momentum = (end_price - start_price) / start_price
-
-        return momentum
+        return self.get_lookback_return(market_data, current_date, lookback_days)
 
     def calculate_allocation(
         self,
@@ -128,15 +117,8 @@ class MomentumStrategy(BaseStrategy):
         if not momentum_scores:
             return {}
 
-        # Sort by momentum (descending)
-        sorted_assets = sorted(
-            momentum_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        # Select top N
-        top_assets = sorted_assets[:self.top_n]
+        # Select top N by momentum (descending) without sorting every asset
+        top_assets = heapq.nlargest(self.top_n, momentum_scores.items(), key=itemgetter(1))
 
         # Calculate allocation
         allocation = {}
@@ -235,16 +217,12 @@ class DualMomentumStrategy(BaseStrategy):
 
         for symbol in self.symbols:
             if symbol in market_data:
-                md = market_data[symbol]
-                data = self.get_lookback_data(md, current_date, self.lookback_days)
-
-                if len(data) >= self.lookback_days:
-                    start_price = data[0].close
-                    end_price = data[-1].close
+                momentum = self.get_lookback_return(
+                    market_data[symbol], current_date, self.lookback_days
+                )
 
-                    if start_price > 0:
-                        momentum = (end_price - start_price) / start_price
-                        momentum_scores[symbol] = momentum
+                if momentum is not None:
+                    momentum_scores[symbol] = momentum
 
         if not momentum_scores:
             # No data, go to cash
@@ -340,19 +318,16 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
 
         md = market_data[self.symbol]
 
-        # Get sufficient data for slow MA
-        data = self.get_lookback_data(md, current_date, self.slow_period)
+        # Get sufficient closes for slow MA
+        closes = md.window(current_date, self.slow_period)
 
-        if len(data) < self.slow_period:
+        if len(closes) < self.slow_period or len(closes) < self.fast_period:
             # Insufficient data, stay in cash
             return {self.cash_proxy: 100.0}
 
         # Calculate moving averages
-        fast_ma = self.calculate_moving_average(data, self.fast_period)
-        slow_ma = self.calculate_moving_average(data, self.slow_period)
-
-        if fast_ma is None or slow_ma is None:
-            return {self.cash_proxy: 100.0}
+        fast_ma = sum(closes[-self.fast_period:]) / self.fast_period
+        slow_ma = sum(closes) / self.slow_period
 
         # Generate signal
         if fast_ma > slow_ma:
@@ -79,17 +79,17 @@ class RiskParityStrategy(BaseStrategy):
         Returns:
             Annualized volatility or None
         """
-        data = self.get_lookback_data(market_data, current_date, lookback_days)
+        closes = market_data.window(current_date, lookback_days)
 
-        if len(data) < 2:
+        if len(closes) < 2:
             return None
 
         # Calculate daily returns
-        returns = []
-        for i in range(1, len(data)):
-            if data[i-1].close > 0:
-                ret = (data[i].close - data[i-1].close) / data[i-1].close
-                returns.append(ret)
+        returns = [
+            (current - previous) / previous
+            for previous, current in zip(closes, closes[1:])
+            if previous > 0
+        ]
 
         if len(returns) < 2:
             return None
@@ -232,17 +232,17 @@ class VolatilityTargetingStrategy(BaseStrategy):
             return {self.cash_proxy: 100.0}
 
         md = market_data[self.symbol]
-        data = self.get_lookback_data(md, current_date, self.lookback_days)
+        closes = md.window(current_date, self.lookback_days)
 
-        if len(data) < 2:
+        if len(closes) < 2:
             return {self.cash_proxy: 100.0}
 
         # Calculate returns
-        returns = []
-        for i in range(1, len(data)):
-            if data[i-1].close > 0:
-                ret = (data[i].close - data[i-1].close) / data[i-1].close
-                returns.append(ret)
+        returns = [
+            (current - previous) / previous
+            for previous, current in zip(closes, closes[1:])
+            if previous > 0
+        ]
 
         if len(returns) < 2:
             return {self.cash_proxy: 100.0}
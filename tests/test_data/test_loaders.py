@@ -12,7 +12,9 @@ from datetime import date
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from stocksimulator.data.loaders import CSVLoader, load_from_csv, load_multiple_csv, discover_csv_files
+from stocksimulator.data.loaders import (
+    CSVLoader, load_from_csv, load_multiple_csv, discover_csv_files, parse_iso_date
+)
 from stocksimulator.models.market_data import MarketData
 
 
@@ -142,6 +144,29 @@ class TestHelperFunctions(unittest.TestCase):
             load_from_csv('nonexistent_file.csv', 'TEST', self.data_path)
 
 
+class TestParseIsoDate(unittest.TestCase):
+    """Test the YYYY-MM-DD date parser."""
+
+    def test_parses_padded_date(self):
+        """Standard ISO dates should parse."""
+        self.assertEqual(parse_iso_date('2020-03-07'), date(2020, 3, 7))
+
+    def test_parses_unpadded_date(self):
+        """Unpadded dates accepted by strptime should still parse."""
+        self.assertEqual(parse_iso_date('2020-3-7'), date(2020, 3, 7))
+
+    def test_invalid_date_raises(self):
+        """Invalid dates should raise ValueError."""
+        with self.assertRaises(ValueError):
+            parse_iso_date('2020-13-01')
+
+    def test_other_iso_forms_rejected(self):
+        """Compact and week dates should be rejected on every Python version."""
+        for date_str in ('20200307', '2020-W10-6'):
+            with self.assertRaises(ValueError):
+                parse_iso_date(date_str)
+
+
 class TestMarketData(unittest.TestCase):
     """Test MarketData class methods."""
 
@@ -7,6 +7,7 @@ Tests indicator calculations with known values.
 import unittest
 import sys
 import os
+import math
 from datetime import date
 
 # Add src to path
@@ -68,6 +69,49 @@ class TestRSI(unittest.TestCase):
                 self.assertGreaterEqual(value, 0)
                 self.assertLessEqual(value, 100)
 
+    def test_rsi_matches_full_window_sums(self):
+        """Running window sums should match summing each window directly."""
+        prices = [100.0, 101.3, 99.8, 102.7, 102.7, 98.1, 97.4, 103.9, 105.2,
+                  104.0, 104.0, 106.6, 101.2, 100.5, 107.3, 108.1, 103.3]
+        period = 4
+        changes = [b - a for a, b in zip(prices, prices[1:])]
+        expected = [None]
+        for i in range(period - 1, len(changes)):
+            window = changes[i - period + 1:i + 1]
+            avg_gain = sum(max(c, 0) for c in window) / period
+            avg_loss = sum(-min(c, 0) for c in window) / period
+            expected.append(100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+        values = RSI(period=period).calculate(prices)
+
+        self.assertEqual(len(values), len(expected))
+        for value, exp in zip(values[1:], expected[1:]):
+            self.assertAlmostEqual(value, exp, places=9)
+
+    def test_rsi_recovers_after_nan(self):
+        """A NaN price should only affect the windows that contain it."""
+        prices = [100.0, 101.0, float('nan'), 102.0, 101.0, 103.0, 104.0, 103.5, 105.0]
+        period = 3
+        values = RSI(period=period).calculate(prices)
+
+        changes = [b - a for a, b in zip(prices, prices[1:])]
+        for i in range(period - 1, len(changes)):
+            window = changes[i - period + 1:i + 1]
+            if any(math.isnan(c) for c in window):
+                self.assertTrue(math.isnan(values[i - period + 2]))
+                continue
+            avg_gain = sum(max(c, 0) for c in window) / period
+            avg_loss = sum(-min(c, 0) for c in window) / period
+            expected = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            self.assertAlmostEqual(values[i - period + 2], expected, places=9)
+
+    def test_rsi_losses_leave_window(self):
+        """RSI should return exactly 100 once all losses leave the window."""
+        prices = [100.0, 99.7, 100.1, 100.4, 100.9, 101.3, 101.6]
+        values = RSI(period=3).calculate(prices)
+        self.assertEqual(values[-1], 100.0)
+        self.assertEqual(values[-2], 100.0)
+
 
 class TestMACD(unittest.TestCase):
     """Test MACD indicator."""
@@ -134,6 +178,46 @@ class TestBollingerBands(unittest.TestCase):
         valid_results = [r for r in results if r is not None]
         self.assertGreater(len(valid_results), 0)
 
+    def test_bollinger_bands_match_full_window(self):
+        """Rolling updates should match recomputing each window from scratch."""
+        data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'historical_data')
+        spy_data = load_from_csv('sp500_stooq_daily.csv', 'SPY', data_path)
+
+        prices = [p.close for p in spy_data.data]
+        period = 20
+        results = BollingerBands(period=period, num_std=2.0).calculate(prices)
+
+        self.assertEqual(len(results), len(prices))
+        for i in range(period - 1, len(prices), 97):
+            window = prices[i - period + 1:i + 1]
+            middle = sum(window) / period
+            std_dev = (sum((p - middle) ** 2 for p in window) / period) ** 0.5
+
+            self.assertAlmostEqual(results[i].middle, middle, delta=1e-9 * middle)
+            self.assertAlmostEqual(results[i].upper, middle + 2.0 * std_dev, delta=1e-6 * middle)
+
+    def test_bollinger_bands_constant_prices(self):
+        """Constant prices should give zero-width bands."""
+        results = BollingerBands(period=5).calculate([50.0] * 10)
+
+        self.assertIsNone(results[3])
+        self.assertEqual(results[-1].upper, 50.0)
+        self.assertEqual(results[-1].lower, 50.0)
+
+    def test_bollinger_bands_recover_after_nan(self):
+        """A NaN price should only affect the windows that contain it."""
+        prices = [100.0, 101.0, float('nan'), 102.0, 103.0, 105.0, 106.0, 104.0, 108.0, 109.0]
+        results = BollingerBands(period=3).calculate(prices)
+
+        for i in (2, 3, 4):
+            self.assertTrue(math.isnan(results[i].middle))
+        for i in range(5, len(prices)):
+            window = prices[i - 2:i + 1]
+            middle = sum(window) / 3
+            std_dev = (sum((p - middle) ** 2 for p in window) / 3) ** 0.5
+            self.assertAlmostEqual(results[i].middle, middle, places=9)
+            self.assertAlmostEqual(results[i].upper, middle + 2.0 * std_dev, places=9)
+
 
 class TestATR(unittest.TestCase):
     """Test Average True Range indicator."""
@@ -0,0 +1,256 @@
+"""
+Test suite for the MarketData model.
+
+Tests date-range access helpers on synthetic price series.
+"""
+
+import unittest
+import sys
+import os
+from datetime import date, timedelta
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from stocksimulator.models.market_data import MarketData, OHLCV
+
+
+def make_market_data(num_days: int = 10, start: date = date(2020, 1, 1)) -> MarketData:
+    """Build a MarketData with one bar per calendar day and rising closes."""
+    data = []
+    for i in range(num_days):
+        price = 100.0 + i
+        data.append(OHLCV(
+            date=start + timedelta(days=i),
+            open=price,
+            high=price,
+            low=price,
+            close=price,
+            volume=1000,
+            adjusted_close=price
+        ))
+    return MarketData('TEST', data)
+
+
+class TestMarketDataSlice(unittest.TestCase):
+    """Test MarketData.slice."""
+
+    def setUp(self):
+        """Create synthetic market data."""
+        self.md = make_market_data()
+
+    def test_slice_is_inclusive(self):
+        """Slice should include both boundary dates."""
+        sliced = self.md.slice(date(2020, 1, 3), date(2020, 1, 5))
+
+        self.assertEqual(
+            [d.date for d in sliced.data],
+            [date(2020, 1, 3), date(2020, 1, 4), date(2020, 1, 5)]
+        )
+        self.assertEqual(sliced.symbol, 'TEST')
+
+    def test_slice_open_bounds(self):
+        """Missing bounds should default to the full history."""
+        self.assertEqual(len(self.md.slice().data), 10)
+        self.assertEqual(len(self.md.slice(end_date=date(2020, 1, 2)).data), 2)
+        self.assertEqual(len(self.md.slice(start_date=date(2020, 1, 9)).data), 2)
+
+    def test_slice_does_not_modify_original(self):
+        """Slicing should leave the source data untouched."""
+        self.md.slice(date(2020, 1, 3), date(2020, 1, 5))
+        self.assertEqual(len(self.md.data), 10)
+
+    def test_slice_handles_unsorted_data(self):
+        """Slice should work on data that is not in date order."""
+        md = MarketData('TEST', list(reversed(self.md.data)))
+        sliced = md.slice(date(2020, 1, 2), date(2020, 1, 3))
+
+        self.assertEqual([d.close for d in sliced.data], [101.0, 102.0])
+
+
+class TestMarketDataPriceLookup(unittest.TestCase):
+    """Test get_price_on_date."""
+
+    def setUp(self):
+        self.md = make_market_data()
+
+    def test_price_on_date(self):
+        """Should return the close for a known date and None otherwise."""
+        self.assertEqual(self.md.get_price_on_date(date(2020, 1, 4)), 103.0)
+        self.assertIsNone(self.md.get_price_on_date(date(2019, 12, 31)))
+
+    def test_price_lookup_sees_added_data(self):
+        """Points added after a lookup should still be found."""
+        self.md.get_price_on_date(date(2020, 1, 1))
+        self.md.add_data_point(OHLCV(
+            date=date(2020, 2, 1), open=150.0, high=150.0, low=150.0,
+            close=150.0, volume=1000, adjusted_close=150.0
+        ))
+
+        self.assertEqual(self.md.get_price_on_date(date(2020, 2, 1)), 150.0)
+
+    def test_price_lookup_sees_replaced_data(self):
+        """Replacing the data list should rebuild the lookup."""
+        self.md.get_price_on_date(date(2020, 1, 1))
+        self.md.data = make_market_data(start=date(2021, 1, 1)).data
+
+        self.assertIsNone(self.md.get_price_on_date(date(2020, 1, 1)))
+        self.assertEqual(self.md.get_price_on_date(date(2021, 1, 1)), 100.0)
+
+    def test_price_lookup_sees_in_place_sort(self):
+        """Lookups should follow an in-place sort once the cache is invalidated."""
+        md = make_market_data(num_days=5)
+        md.data.reverse()
+        self.assertEqual(md.get_price_on_date(date(2020, 1, 1)), 100.0)
+
+        md.data.sort(key=lambda x: x.date)
+        md.invalidate_cache()
+
+        self.assertEqual(md.get_price_on_date(date(2020, 1, 1)), 100.0)
+        self.assertEqual(md.get_price_on_date(date(2020, 1, 5)), 104.0)
+
+    def test_price_lookup_sees_replaced_point(self):
+        """A point replaced in place should be served after invalidate_cache."""
+        self.md.get_price_on_date(date(2020, 1, 10))
+        self.md.data[-1] = OHLCV(
+            date=date(2020, 1, 10), open=200.0, high=200.0, low=200.0,
+            close=200.0, volume=1000, adjusted_close=200.0
+        )
+        self.md.invalidate_cache()
+
+        self.assertEqual(self.md.get_price_on_date(date(2020, 1, 10)), 200.0)
+
+
+class TestMarketDataColumns(unittest.TestCase):
+    """Test sorted and column views."""
+
+    def setUp(self):
+        self.md = MarketData('TEST', list(reversed(make_market_data(num_days=5).data)))
+
+    def test_columns_in_date_order(self):
+        """Columns should be parallel lists in date order."""
+        columns = self.md.as_columns()
+
+        self.assertEqual(columns['date'], [date(2020, 1, i) for i in range(1, 6)])
+        self.assertEqual(columns['close'], [100.0, 101.0, 102.0, 103.0, 104.0])
+        self.assertEqual(
+            [d.date for d in self.md.get_sorted_data()], columns['date']
+        )
+
+    def test_columns_follow_added_data(self):
+        """Adding a point should rebuild the cached views."""
+        self.md.as_columns()
+        self.md.add_data_point(OHLCV(
+            date=date(2019, 12, 31), open=99.0, high=99.0, low=99.0,
+            close=99.0, volume=1000, adjusted_close=99.0
+        ))
+
+        self.assertEqual(self.md.as_columns()['close'][0], 99.0)
+        self.assertEqual(self.md.get_sorted_data()[0].date, date(2019, 12, 31))
+
+    def test_lookups_agree_after_edit_through_slice(self):
+        """Price lookups and columns should serve the same snapshot."""
+        md = make_market_data(num_days=5)
+        last = date(2020, 1, 5)
+        md.get_price_on_date(last)
+
+        point = md.slice().data[-1]
+        point.close = 555.0
+        point.adjusted_close = None
+
+        self.assertEqual(md.get_price_on_date(last), 104.0)
+        self.assertEqual(md.window(last, 1), [104.0])
+        self.assertEqual(md.get_returns()[-1]['price'], 104.0)
+
+        md.invalidate_cache()
+
+        self.assertEqual(md.get_price_on_date(last), 555.0)
+        self.assertEqual(md.window(last, 1), [555.0])
+        self.assertEqual(md.get_returns()[-1]['price'], 555.0)
+
+    def test_reading_data_keeps_views(self):
+        """Reading data should not discard the cached views."""
+        columns = self.md.as_columns()
+        self.assertEqual(len(self.md.data), 5)
+        self.assertIs(self.md.as_columns(), columns)
+
+    def test_views_follow_in_place_edits(self):
+        """Invalidating after in-place edits should rebuild every cached view."""
+        self.md.as_columns()
+        self.md.data[0].close = 204.0  # 2020-01-05, the last date
+        self.md.invalidate_cache()
+
+        self.assertEqual(self.md.as_columns()['close'][-1], 204.0)
+        self.assertEqual(self.md.window(date(2020, 1, 5), 2), [103.0, 204.0])
+
+        self.md.data[:] = self.md.data[1:] + [OHLCV(
+            date=date(2020, 1, 6), open=105.0, high=105.0, low=105.0,
+            close=105.0, volume=1000, adjusted_close=105.0
+        )]
+        self.md.invalidate_cache()
+
+        self.assertEqual(self.md.get_sorted_data()[-1].date, date(2020, 1, 6))
+        self.assertEqual(self.md.slice(start_date=date(2020, 1, 4)).data[-1].close, 105.0)
+
+
+class TestMarketDataWindow(unittest.TestCase):
+    """Test window."""
+
+    def setUp(self):
+        self.md = make_market_data()
+
+    def test_window_ends_on_date(self):
+        """Window should hold the last values up to and including end_date."""
+        self.assertEqual(self.md.window(date(2020, 1, 5), 3), [102.0, 103.0, 104.0])
+
+    def test_window_truncated_at_start(self):
+        """Window should be shorter when history is insufficient."""
+        self.assertEqual(self.md.window(date(2020, 1, 2), 5), [100.0, 101.0])
+        self.assertEqual(self.md.window(date(2019, 12, 31), 5), [])
+
+    def test_window_other_field(self):
+        """Window should read the requested field."""
+        self.assertEqual(self.md.window(date(2020, 1, 2), 2, field='volume'), [1000, 1000])
+
+
+class TestMarketDataReturns(unittest.TestCase):
+    """Test get_returns."""
+
+    def test_returns_in_date_order(self):
+        """Returns should follow date order regardless of storage order."""
+        md = make_market_data(num_days=4)
+        md.data.reverse()
+        returns = md.get_returns(period_days=2)
+        self.assertEqual([r['date'] for r in returns], [date(2020, 1, 3), date(2020, 1, 4)])
+        self.assertAlmostEqual(returns[0]['return'], 2.0 / 100.0)
+        self.assertEqual(returns[1]['price'], 103.0)
+
+    def test_zero_previous_price_skipped(self):
+        """A zero previous price should not produce a return."""
+        md = make_market_data(num_days=3)
+        md.data[0].close = 0.0
+        md.data[0].adjusted_close = None
+        self.assertEqual([r['date'] for r in md.get_returns()], [date(2020, 1, 3)])
+
+
+class TestMarketDataMaxDrawdown(unittest.TestCase):
+    """Test get_max_drawdown."""
+
+    def test_drawdown_and_trough(self):
+        """Max drawdown should be measured from the running peak."""
+        md = make_market_data(num_days=5)
+        for bar, price in zip(md.data, [100.0, 120.0, 90.0, 110.0, 96.0]):
+            bar.close = bar.adjusted_close = price
+        result = md.get_max_drawdown()
+        self.assertAlmostEqual(result['max_drawdown'], 25.0)
+        self.assertEqual(result['trough_date'], date(2020, 1, 3))
+
+    def test_rising_series_has_no_drawdown(self):
+        """A monotonically rising series should report zero drawdown."""
+        result = make_market_data().get_max_drawdown()
+        self.assertEqual(result['max_drawdown'], 0)
+        self.assertIsNone(result['trough_date'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,8 @@ Comprehensive tests for GridSearchOptimizer, WalkForwardAnalyzer, and Position S
 import unittest
 import sys
 import os
+import io
+from contextlib import redirect_stdout
 from datetime import date
 
 # Add parent directory to path
@@ -21,6 +23,12 @@ from stocksimulator.optimization import (
     KellyCriterion,
     FixedFractional
 )
+from stocksimulator.optimization.walk_forward import (
+    WalkForwardResult,
+    _init_window_worker,
+    _run_window_in_worker,
+    _window_context
+)
 
 
 class TestGridSearchOptimizer(unittest.TestCase):
@@ -162,6 +170,95 @@ class TestGridSearchOptimizer(unittest.TestCase):
         self.assertIsNotNone(results_sharpe[0].metric_value)
         self.assertIsNotNone(results_return[0].metric_value)
 
+    def test_optimize_parallel_matches_serial(self):
+        """Parallel grid search should rank the same results as a serial run."""
+        backtester = Backtester(initial_cash=100000.0)
+        optimizer = GridSearchOptimizer(
+            backtester=backtester,
+            optimization_metric='sharpe_ratio'
+        )
+
+        param_grid = {
+            'lookback_days': [20, 60],
+            'top_n': [1]
+        }
+        start_date = date(self.end_date.year, 1, 1)
+
+        serial = optimizer.optimize(
+            strategy_class=MomentumStrategy,
+            param_grid=param_grid,
+            market_data={'SPY': self.spy_data},
+            start_date=start_date,
+            end_date=self.end_date,
+            top_n=2
+        )
+
+        parallel = optimizer.optimize(
+            strategy_class=MomentumStrategy,
+            param_grid=param_grid,
+            market_data={'SPY': self.spy_data},
+            start_date=start_date,
+            end_date=self.end_date,
+            top_n=2,
+            n_jobs=2
+        )
+
+        self.assertEqual(
+            [r.parameters for r in parallel],
+            [r.parameters for r in serial]
+        )
+        for p, s in zip(parallel, serial):
+            self.assertAlmostEqual(p.metric_value, s.metric_value, places=9)
+
+    def test_optimize_rejects_invalid_n_jobs(self):
+        """n_jobs of 0 or below -1 should raise instead of guessing."""
+        optimizer = GridSearchOptimizer(optimization_metric='sharpe_ratio')
+
+        for n_jobs in (0, -2):
+            with self.assertRaises(ValueError):
+                optimizer.optimize(
+                    strategy_class=MomentumStrategy,
+                    param_grid={'lookback_days': [20], 'top_n': [1]},
+                    market_data={'SPY': self.spy_data},
+                    start_date=date(self.end_date.year, 1, 1),
+                    end_date=self.end_date,
+                    n_jobs=n_jobs,
+                    verbose=False
+                )
+
+    def test_optimize_prune_fn_skips_combinations(self):
+        """Pruned combinations should never be backtested."""
+        backtester = Backtester(initial_cash=100000.0)
+        optimizer = GridSearchOptimizer(
+            backtester=backtester,
+            optimization_metric='sharpe_ratio'
+        )
+
+        evaluated = []
+        original_evaluate = optimizer.evaluate_parameters
+
+        def tracking_evaluate(strategy_class, parameters, *args, **kwargs):
+            evaluated.append(parameters)
+            return original_evaluate(strategy_class, parameters, *args, **kwargs)
+
+        optimizer.evaluate_parameters = tracking_evaluate
+
+        results = optimizer.optimize(
+            strategy_class=MomentumStrategy,
+            param_grid={'lookback_days': [20, 60, 500], 'top_n': [1]},
+            market_data={'SPY': self.spy_data},
+            start_date=date(self.end_date.year, 1, 1),
+            end_date=self.end_date,
+            top_n=5,
+            prune_fn=lambda params: params['lookback_days'] > 252
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            sorted(p['lookback_days'] for p in evaluated),
+            [20, 60]
+        )
+
 
 class TestWalkForwardAnalyzer(unittest.TestCase):
     """Test WalkForwardAnalyzer functionality."""
@@ -178,6 +275,7 @@ class TestWalkForwardAnalyzer(unittest.TestCase):
         analyzer = WalkForwardAnalyzer(backtester=backtester)
 
         self.assertIsNotNone(analyzer.backtester)
+        self.assertIs(analyzer.optimizer.backtester, backtester)
 
     def test_walk_forward_analysis(self):
         """Should perform walk-forward analysis."""
@@ -227,6 +325,112 @@ class TestWalkForwardAnalyzer(unittest.TestCase):
             self.assertIn('avg_return', summary)
             self.assertIn('avg_sharpe', summary)
 
+    def test_walk_forward_result_summary(self):
+        """Summary should average test metrics and follow edited periods."""
+        def period(ret, sharpe, dd):
+            return {'summary': {
+                'annualized_return': ret, 'sharpe_ratio': sharpe, 'max_drawdown': dd
+            }}
+
+        result = WalkForwardResult([], [period(10.0, 1.0, -5.0), period(20.0, 2.0, -15.0)])
+        summary = result.get_summary()
+
+        self.assertEqual(summary['num_periods'], 2)
+        self.assertAlmostEqual(summary['avg_return'], 15.0)
+        self.assertAlmostEqual(summary['avg_sharpe'], 1.5)
+        self.assertAlmostEqual(summary['avg_max_drawdown'], -10.0)
+
+        result.test_results.append(period(30.0, 3.0, -10.0))
+        self.assertEqual(result.get_summary()['num_periods'], 3)
+        self.assertAlmostEqual(result.get_summary()['avg_sharpe'], 2.0)
+
+        result.test_results[0] = period(40.0, 4.0, -20.0)
+        self.assertAlmostEqual(result.get_summary()['avg_return'], 30.0)
+
+    def test_walk_forward_quiet(self):
+        """verbose=False should print nothing but still return results."""
+        analyzer = WalkForwardAnalyzer(backtester=Backtester(initial_cash=100000.0))
+
+        last_date = max(d.date for d in self.spy_data.data)
+        market_data = {
+            'SPY': self.spy_data.slice(start_date=date(last_date.year - 2, 1, 1))
+        }
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = analyzer.analyze(
+                strategy_class=MomentumStrategy,
+                param_grid={'lookback_days': [20, 60]},
+                market_data=market_data,
+                train_days=126,
+                test_days=63,
+                step_days=126,
+                verbose=False
+            )
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertGreater(len(result.test_results), 0)
+
+    def test_walk_forward_parallel_matches_serial(self):
+        """Parallel windows should produce the same periods as serial."""
+        backtester = Backtester(initial_cash=100000.0)
+        analyzer = WalkForwardAnalyzer(backtester=backtester)
+
+        last_date = max(d.date for d in self.spy_data.data)
+        market_data = {
+            'SPY': self.spy_data.slice(start_date=date(last_date.year - 2, 1, 1))
+        }
+        param_grid = {'lookback_days': [20, 60]}
+
+        serial = analyzer.analyze(
+            strategy_class=MomentumStrategy,
+            param_grid=param_grid,
+            market_data=market_data,
+            train_days=126,
+            test_days=63,
+            step_days=126
+        )
+        parallel = analyzer.analyze(
+            strategy_class=MomentumStrategy,
+            param_grid=param_grid,
+            market_data=market_data,
+            train_days=126,
+            test_days=63,
+            step_days=126,
+            n_jobs=2
+        )
+
+        self.assertGreater(len(serial.test_results), 1)
+        self.assertEqual(
+            [(r['period'], r['parameters']) for r in serial.test_results],
+            [(r['period'], r['parameters']) for r in parallel.test_results]
+        )
+        for s_result, p_result in zip(serial.test_results, parallel.test_results):
+            self.assertAlmostEqual(
+                s_result['summary']['sharpe_ratio'],
+                p_result['summary']['sharpe_ratio']
+            )
+
+    def test_walk_forward_worker_window_is_quiet(self):
+        """Worker windows should not print grid search progress."""
+        dates = [d.date for d in self.spy_data.data]
+        window = (1, dates[-300], dates[-100], dates[-100], dates[-1])
+
+        _init_window_worker(
+            GridSearchOptimizer(optimization_metric='sharpe_ratio'),
+            MomentumStrategy,
+            {'lookback_days': [20, 60], 'top_n': [1]},
+            {'SPY': self.spy_data}
+        )
+        self.addCleanup(_window_context.clear)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            outcome = _run_window_in_worker(window)
+
+        self.assertIsNotNone(outcome)
+        self.assertEqual(output.getvalue(), '')
+
 
 class TestPositionSizing(unittest.TestCase):
     """Test position sizing calculators."""
@@ -289,6 +493,15 @@ class TestPositionSizing(unittest.TestCase):
         # Should be very small or 0
         self.assertLessEqual(position, 1000)
 
+    def test_kelly_no_edge_is_zero(self):
+        """Kelly should size to exactly 0 without a positive edge."""
+        kelly = KellyCriterion(fraction=1.0)
+
+        # Break-even: 0.5 * 0.03 == 0.5 * 0.03
+        self.assertEqual(kelly.calculate_position_size(100000, 0.5, 0.03, 0.03), 0.0)
+        self.assertEqual(kelly.calculate_position_size(100000, 0.6, -0.02, 0.03), 0.0)
+        self.assertEqual(kelly.calculate_position_size(100000, 0.6, 0.05, -0.03), 0.0)
+
     def test_kelly_half_fraction(self):
         """Half-Kelly should be ~50% of full Kelly."""
         kelly_full = KellyCriterion(fraction=1.0)
@@ -382,6 +595,53 @@ class TestPositionSizing(unittest.TestCase):
         # Aggressive should be 5x conservative
         self.assertAlmostEqual(pos_aggressive, pos_conservative * 5, delta=1000)
 
+    def test_kelly_batch_matches_scalar(self):
+        """Batch Kelly sizing should match per-trade sizing."""
+        kelly = KellyCriterion(fraction=0.5)
+
+        account_values = [100000, 50000, 75000, 20000, 30000]
+        win_rates = [0.60, 0.40, 0.55, 0.50, 0.50]
+        avg_wins = [0.05, 0.02, 0.04, 0.03, 0.0]
+        avg_losses = [0.03, 0.05, 0.03, 0.0, 0.03]
+
+        batch = kelly.calculate_position_size_batch(
+            account_values, win_rates, avg_wins, avg_losses
+        )
+        expected = [
+            kelly.calculate_position_size(v, p, w, l)
+            for v, p, w, l in zip(account_values, win_rates, avg_wins, avg_losses)
+        ]
+
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch[3:], [0.0, 0.0])
+        for got, want in zip(batch, expected):
+            self.assertAlmostEqual(got, want)
+
+    def test_fixed_fractional_batch_matches_scalar(self):
+        """Batch fixed fractional sizing should match per-trade sizing."""
+        ff = FixedFractional(risk_pct=0.02)
+
+        account_values = [100000, 50000, 75000]
+        stop_loss_pcts = [0.05, 0.10, None]
+
+        batch = ff.calculate_position_size_batch(account_values, stop_loss_pcts)
+        expected = [
+            ff.calculate_position_size(account_value=v, stop_loss_pct=s)
+            for v, s in zip(account_values, stop_loss_pcts)
+        ]
+
+        self.assertEqual(batch, expected)
+
+    def test_batch_rejects_mismatched_lengths(self):
+        """Batch sizing should raise instead of truncating uneven inputs."""
+        kelly = KellyCriterion(fraction=0.5)
+        ff = FixedFractional(risk_pct=0.02)
+
+        with self.assertRaises(ValueError):
+            kelly.calculate_position_size_batch([100000, 50000], [0.60], [0.05, 0.04], [0.03, 0.03])
+        with self.assertRaises(ValueError):
+            ff.calculate_position_size_batch([100000, 50000], [0.05])
+
 
 class TestOptimizationIntegration(unittest.TestCase):
     """Integration tests for optimization workflow."""
@@ -7,13 +7,14 @@ Tests various strategy implementations.
 import unittest
 import sys
 import os
-from datetime import date
+from datetime import date, timedelta
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from stocksimulator.data import load_from_csv
 from stocksimulator.core.backtester import Backtester
+from stocksimulator.models.market_data import MarketData, OHLCV
 from stocksimulator.strategies import (
     DCAStrategy, FixedAllocationStrategy, Balanced6040Strategy,
     MomentumStrategy, RiskParityStrategy
@@ -123,6 +124,42 @@ class TestMomentumStrategy(unittest.TestCase):
             self.assertGreater(allocation['SPY'], 0)
             self.assertLessEqual(allocation['SPY'], 100.0)
 
+    def test_momentum_matches_lookback_data(self):
+        """Momentum should equal the return over get_lookback_data."""
+        strategy = MomentumStrategy(lookback_days=126, top_n=1)
+        current_date = self.spy_data.data[-50].date
+
+        data = strategy.get_lookback_data(self.spy_data, current_date, 126)
+        expected = (data[-1].close - data[0].close) / data[0].close
+
+        self.assertAlmostEqual(
+            strategy.calculate_momentum(self.spy_data, current_date, 126), expected
+        )
+        self.assertIsNone(
+            strategy.calculate_momentum(self.spy_data, self.spy_data.data[10].date, 126)
+        )
+
+    def test_momentum_selects_top_n(self):
+        """Momentum should hold the top_n strongest assets."""
+        start = date(2020, 1, 1)
+
+        def trending(symbol, daily_change):
+            return MarketData(symbol, [
+                OHLCV(start + timedelta(days=i), 0, 0, 0, 100.0 + daily_change * i, 0)
+                for i in range(30)
+            ])
+
+        market_data = {
+            'LOW': trending('LOW', 0.1),
+            'HIGH': trending('HIGH', 1.0),
+            'MID': trending('MID', 0.5),
+        }
+        strategy = MomentumStrategy(lookback_days=20, top_n=2)
+
+        allocation = strategy(start + timedelta(days=29), market_data, None, {})
+
+        self.assertEqual(allocation, {'HIGH': 50.0, 'MID': 50.0})
+
     def test_momentum_with_backtest(self):
         """Momentum strategy should work in backtest."""
         strategy = MomentumStrategy(lookback_days=60, top_n=1)